@@ -1,63 +1,24 @@
 #!/usr/bin/env python3
 """
 Complex SQL test cases for the MSSQL to Spring EL converter.
-These demonstrate various levels of complexi        # Level 20: The ultimate nightmare scenario
-        {
-            "name": "Ultimate nightmare complexity",
-            "sql": "CASE WHEN ([user-profile].[age-group] IN ('25-35', '36-45') AND [employment-data].[salary-band] >= 75000 AND NOT ([performance-metrics].[rating] < 3.0 OR [absence-records].[days-missed] > 15)) THEN CASE WHEN dept.[budget-allocation] > 500000 THEN 'High_Value_Employee' ELSE 'Standard_Employee' END WHEN contractor.[hourly-rate] BETWEEN 50 AND 150 AND proj.[deadline-pressure] = 'high' THEN 'Critical_Contractor' ELSE 'Regular_Worker' END AND ([audit-trail].[last-modified] >= '2023-06-01' OR [system-flags].[force-include] = true) AND NOT (usr.[email] LIKE '%@competitor.com' OR [security-clearance].[level] = 'restricted')",
-        },
-        
-        # Whitespace Edge Cases
-        {
-            "name": "Extra spaces everywhere",
-            "sql": "WHERE   age    >    18   AND    status   =   'active'   OR    department    IN    ('IT',   'HR')  ",
-        },
-        
-        {
-            "name": "Tabs instead of spaces",
-            "sql": "WHERE\tage\t>\t18\tAND\tstatus\t=\t'active'\tOR\tdepartment\tIN\t('IT',\t'HR')",
-        },
-        
-        {
-            "name": "Multiline SQL with mixed whitespace",
-            "sql": "WHERE age > 18\n            AND status = 'active'\n            OR (department IN ('IT', 'HR')\n                AND salary >= 50000)",
-        },
-        
-        {
-            "name": "Chaotic whitespace mix",
-            "sql": "WHERE  \\t age\\t> \\n18   AND\\t\\t\\n            status =  'active' \\t\\n            OR   \\tdepartment\\nIN  ('IT',\\t'HR')",
-        },
-        
-        {
-            "name": "CASE with newlines and tabs",
-            "sql": "CASE\\tWHEN age\\n>\\t65\\n            THEN\\t'Senior'\\n            WHEN\\nage > 18\\t\\n            THEN 'Adult'\\n\\n            ELSE   'Minor'\\t\\n            END",
-        },
-        
-        {
-            "name": "Functions with whitespace chaos",
-            "sql": "WHERE ISNULL\\t(\\n  name  ,\\t  'Unknown'\\n  )\\t=  'John'\\tAND\\nLEN( description\\t) >  100",
-        },
-        
-        {
-            "name": "Whitespace in string literals preserved",
-            "sql": "WHERE description = 'This has  multiple   spaces' AND comment = '  Leading and trailing  '",
-        },
-        
-        {
-            "name": "Minimal spacing (challenging)",
-            "sql": "WHERE age>18AND status='active'OR department='IT'",
-        },d edge cases.
+These demonstrate various levels of complexity and edge cases.
 
 This file can be run standalone to see what works and what doesn't,
 helping identify areas for improvement in the parser.
 """
 
-import sys
+import argparse
 import json
-from mylibrary.parser import parse_sql_logic
-from mylibrary.converter import to_spring_el
+import sys
+import time
+from mssql_to_spring_el.parser import parse_sql_logic
+from mssql_to_spring_el.converter import to_spring_el
+
+# Separators built once; rebuilding "=" * 80 per test is wasted work
+_SEP = "=" * 80
+_SUB = "-" * 60
 
-def test_complex_cases():
+def test_complex_cases(show_json=False):
     """Test increasingly complex SQL expressions."""
     
     test_cases = [
@@ -184,44 +145,50 @@ def test_complex_cases():
     
     print("🧪 Testing Complex SQL Expressions")
     print("This helps identify current parser capabilities and limitations\n")
-    print("=" * 80)
+    print(_SEP)
     
     passed = 0
     failed = 0
     skipped = 0
+    total_ns = 0
     
     for i, test_case in enumerate(test_cases, 1):
-        print(f"\n📋 Test {i}: {test_case['name']}")
-        print("-" * 60)
-        print(f"SQL: {test_case['sql']}")
+        # Buffer each test's report and emit it with one write
+        lines = [f"\n📋 Test {i}: {test_case['name']}", _SUB, f"SQL: {test_case['sql']}"]
         
         try:
             # Parse the expression
+            start_ns = time.perf_counter_ns()
             expression = parse_sql_logic(test_case['sql'])
-            print(f"✅ Parsed successfully: {type(expression).__name__}")
+            parse_ns = time.perf_counter_ns() - start_ns
+            lines.append(f"✅ Parsed successfully: {type(expression).__name__}")
             
             # Convert to Spring EL
+            start_ns = time.perf_counter_ns()
             spring_el = to_spring_el(expression)
-            print(f"🔄 Spring EL: {spring_el}")
+            convert_ns = time.perf_counter_ns() - start_ns
+            total_ns += parse_ns + convert_ns
+            lines.append(f"🔄 Spring EL: {spring_el}")
             
             # Check for parse errors or limitations
             if "PARSE_ERROR" in spring_el:
-                print("⚠️  Contains parse errors - partial functionality")
+                lines.append("⚠️  Contains parse errors - partial functionality")
                 skipped += 1
             else:
-                print("✅ Fully converted")
+                lines.append("✅ Fully converted")
                 passed += 1
             
-            # Test JSON output (optional, only show for first few)
-            if i <= 3:
+            # JSON preview skews timing runs, so it is opt-in
+            if show_json and i <= 3:
                 expr_dict = expression.to_dict()
-                print(f"📄 JSON: {json.dumps(expr_dict, indent=2)}")
+                lines.append(f"📄 JSON: {json.dumps(expr_dict, indent=2)}")
             
         except Exception as e:
-            print(f"❌ Error: {str(e)}")
+            lines.append(f"❌ Error: {str(e)}")
             failed += 1
         
-        print("\n" + "=" * 80)
+        lines.append("\n" + _SEP)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Summary
     print(f"\n📊 Summary:")
@@ -229,20 +196,22 @@ def test_complex_cases():
     print(f"⚠️  Partial/Limited: {skipped}")
     print(f"❌ Failed: {failed}")
     print(f"📈 Success rate: {(passed/(passed+failed+skipped)*100):.1f}%" if (passed+failed+skipped) > 0 else "0%")
+    print(f"⏱️  Total parse+convert time: {total_ns / 1_000_000:.3f} ms")
     
     return passed, skipped, failed
 
-def run_specific_test(test_name_pattern=None):
+def run_specific_test(test_name_pattern=None, show_json=False):
     """Run a specific test or pattern."""
     if not test_name_pattern:
-        return test_complex_cases()
+        return test_complex_cases(show_json=show_json)
     
     # You could add filtering logic here
-    return test_complex_cases()
+    return test_complex_cases(show_json=show_json)
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        pattern = sys.argv[1]
-        run_specific_test(pattern)
-    else:
-        test_complex_cases()
+    arg_parser = argparse.ArgumentParser(description="Run the complex SQL test cases")
+    arg_parser.add_argument('pattern', nargs='?', help="Test name pattern to run")
+    arg_parser.add_argument('--json-preview', action='store_true',
+                            help="Pretty-print parsed JSON for the first few cases")
+    args = arg_parser.parse_args()
+    run_specific_test(args.pattern, show_json=args.json_preview)
@@ -5,15 +5,39 @@ This module traverses the expression AST and generates Spring EL syntax.
 """
 
 import logging
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
 from mssql_to_spring_el.logic_models import (
-    Expression, BinaryOp, UnaryOp, FunctionCall,
+    Expression, BinaryOp, BetweenOp, UnaryOp, FunctionCall,
     Literal, Variable, Conditional, LogicalGroup
 )
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+class Converter:
+    """
+    Reusable Expression-to-Spring-EL converter.
+
+    Prepares the context and operator mapping table once so batch callers
+    (the CLI, migration scripts) don't pay the per-call setup that
+    to_spring_el does. Each convert() call uses a fresh memo cache because
+    node ids are only stable while the converted tree is alive.
+    """
+
+    def __init__(self, context: str = "#root", mappings: Dict[str, str] = None):
+        self.context = context
+        # Property access always goes through "<context>." — build it once
+        self.context_prefix = context + '.'
+        self.mappings = _prepare_mappings(mappings if mappings is not None else _DEFAULT_MAPPINGS)
+
+    def convert(self, expression: Expression) -> str:
+        """Convert Expression object to Spring EL string."""
+        return _convert_expression(expression, self.context_prefix, self.mappings, {})
+
 
 def to_spring_el(expression: Expression, context: str = "#root", mappings: Dict[str, str] = None) -> str:
     """
@@ -30,170 +54,241 @@ def to_spring_el(expression: Expression, context: str = "#root", mappings: Dict[
     Raises:
         ValueError: If expression is invalid
     """
-    logger.debug(f"Converting expression to Spring EL: {expression}")
-    logger.debug(f"Using context: {context}")
-    
-    if mappings is None:
-        mappings = _get_default_mappings()
+    # %-style args defer formatting (including the O(AST) repr) until a
+    # handler actually wants the record
+    logger.debug("Converting expression to Spring EL: %s", expression)
+    logger.debug("Using context: %s", context)
 
-    result = _convert_expression(expression, context, mappings)
-    logger.debug(f"Generated Spring EL: {result}")
+    if mappings is None:
+        try:
+            result = _convert_default(expression, context)
+        except TypeError:
+            # Unhashable input (not an Expression tree) — convert directly
+            # so the caller still gets the usual ValueError.
+            result = Converter(context).convert(expression)
+    else:
+        result = Converter(context, mappings).convert(expression)
+    logger.debug("Generated Spring EL: %s", result)
     return result
 
 
+@lru_cache(maxsize=2048)
+def _convert_default(expression: Expression, context: str) -> str:
+    """Structurally keyed conversion under the default operator mappings.
+
+    Expression nodes hash and compare structurally, so equal trees —
+    including the shared trees the parse caches hand out — convert once
+    per process. Like those caches, this assumes converted trees are not
+    mutated afterwards. Custom-mapping calls bypass this cache because
+    mapping dicts are unhashable.
+    """
+    return Converter(context).convert(expression)
+
+
+def clear_convert_cache() -> None:
+    """Drop memoized conversions (primarily for tests and benchmarks)."""
+    _convert_default.cache_clear()
+
+
+def to_spring_el_batch(expressions, context: str = "#root", mappings: Dict[str, str] = None) -> list:
+    """
+    Convert a sequence of Expression objects to Spring EL strings.
+
+    Shares one prepared mapping table and one memo cache across the whole
+    batch, so subtrees repeated between expressions convert once. The
+    input is materialized up front: the shared cache keys on node
+    identity, which is only stable while every tree stays alive.
+
+    Args:
+        expressions: Iterable of parsed Expression objects
+        context: EL context prefix (default: "#root")
+        mappings: Custom operator mappings (optional)
+
+    Returns:
+        List of Spring EL strings, in input order
+    """
+    exprs = list(expressions)
+    prepared = _prepare_mappings(mappings if mappings is not None else _DEFAULT_MAPPINGS)
+    context_prefix = context + '.'
+    cache = {}
+    return [_convert_expression(expr, context_prefix, prepared, cache) for expr in exprs]
+
+
+# Default operator mappings, built once at import; the read-only proxy
+# guards against callers mutating the shared table.
+_DEFAULT_MAPPINGS = MappingProxyType({
+    'AND': '&&',
+    'OR': '||',
+    '=': '==',
+    '!=': '!=',
+    '<>': '!=',
+    'NOT': '!',
+    'IS': '==',
+    'LIKE': 'matches',  # or =~ for regex
+    'IN': 'contains'
+})
+
+# Interned so downstream equality checks on rendered operator tokens can
+# take the identity fast path
+for _token in _DEFAULT_MAPPINGS.values():
+    sys.intern(_token)
+del _token
+
+
+# Operators that pass through unmapped; pre-seeding identity entries keeps
+# operator resolution to a single dict fetch for the common cases.
+_PASSTHROUGH_OPERATORS = ('>', '<', '>=', '<=', 'IS NULL', 'IS NOT NULL', 'NOT IN', 'BETWEEN')
+
+# Expanded mapping tables keyed by mapping contents, so identical tables
+# share one expansion regardless of which dict object carries them. An
+# id()-based key would be unsafe: CPython reuses a freed dict's id, which
+# would silently serve a previous caller's operator table.
+_PREPARED_CACHE = {}
+
+
+def _prepare_mappings(mappings: Dict[str, str]) -> Dict[str, str]:
+    """
+    Expand an operator mapping table so per-node resolution is one lookup.
+
+    Adds upper/lower/capitalized spellings for every mapped operator and
+    identity entries for operators that convert unchanged.
+    """
+    cache_key = frozenset(mappings.items())
+    prepared = _PREPARED_CACHE.get(cache_key)
+    if prepared is None:
+        prepared = {}
+        for key, value in mappings.items():
+            prepared[key] = value
+            prepared[key.upper()] = value
+            prepared[key.lower()] = value
+            prepared[key.capitalize()] = value
+        for op in _PASSTHROUGH_OPERATORS:
+            prepared.setdefault(op, op)
+        _PREPARED_CACHE[cache_key] = prepared
+    return prepared
+
+
 def _get_default_mappings() -> Dict[str, str]:
     """Get default operator mappings."""
-    return {
-        'AND': '&&',
-        'OR': '||',
-        '=': '==',
-        '!=': '!=',
-        '<>': '!=',
-        'NOT': '!',
-        'IS': '==',
-        'LIKE': 'matches',  # or =~ for regex
-        'IN': 'contains'
-    }
-
-
-def _extract_then_value_with_nesting(content: str) -> tuple[str, str]:
+    return _DEFAULT_MAPPINGS
+
+
+def _convert_expression(expr: Expression, context_prefix: str, mappings: Dict[str, str],
+                        cache: Dict[int, str] = None) -> str:
     """
-    Extract the THEN value from content, handling nested CASE statements.
-    
-    Returns:
-        tuple: (then_value, remaining_content)
+    Convert expression to Spring EL via a type-indexed dispatch table.
+
+    Results are memoized per conversion keyed by node identity, so shared
+    subtrees (common in nested CASE conversion) are only converted once.
+    The cache lives for a single top-level call; nodes are kept alive by
+    the tree root, which makes id() keying safe here.
     """
-    case_depth = 0
-    i = 0
-    
-    while i < len(content):
-        # Look for keywords
-        remaining = content[i:].upper()
-        
-        if remaining.startswith('CASE '):
-            case_depth += 1
-            i += 5
-        elif remaining.startswith('END') and (i + 3 >= len(content) or content[i + 3].isspace()):
-            if case_depth > 0:
-                case_depth -= 1
-                i += 3
-            else:
-                # This END is not part of a nested CASE
-                break
-        elif case_depth == 0:
-            # Only check for WHEN/ELSE when we're not inside a nested CASE
-            if remaining.startswith('WHEN '):
-                break
-            elif remaining.startswith('ELSE '):
-                break
-        
-        i += 1
-    
-    then_value = content[:i].strip()
-    remaining_content = content[i:].strip()
-    
-    return then_value, remaining_content
-
-
-def _convert_expression(expr: Expression, context: str, mappings: Dict[str, str]) -> str:
-    """Convert expression to Spring EL."""
-    if isinstance(expr, BinaryOp):
-        return _convert_binary_op(expr, context, mappings)
-    elif isinstance(expr, UnaryOp):
-        return _convert_unary_op(expr, context, mappings)
-    elif isinstance(expr, FunctionCall):
-        return _convert_function_call(expr, context, mappings)
-    elif isinstance(expr, Literal):
-        return _convert_literal(expr)
-    elif isinstance(expr, Variable):
-        return _convert_variable(expr, context)
-    elif isinstance(expr, Conditional):
-        return _convert_conditional(expr, context, mappings)
-    elif isinstance(expr, LogicalGroup):
-        return f"({_convert_expression(expr.expression, context, mappings)})"
-    else:
+    if cache is None:
+        cache = {}
+    key = id(expr)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    handler = _DISPATCH.get(type(expr))
+    if handler is None:
         raise ValueError(f"Unsupported expression type: {type(expr)}")
+    result = handler(expr, context_prefix, mappings, cache)
+    cache[key] = result
+    return result
+
+
+@lru_cache(maxsize=256)
+def _like_regex(pattern: str) -> str:
+    """
+    Translate a SQL LIKE pattern to its Spring EL regex form.
+
+    '%' matches any sequence and '_' any single character; results are
+    memoized so repeated conversions of the same pattern are free.
+    """
+    return pattern.replace('%', '.*').replace('_', '.')
 
 
-def _convert_binary_op(expr: BinaryOp, context: str, mappings: Dict[str, str]) -> str:
+def _render_contains(right_node: Expression, left: str, right: str, negate: bool) -> str:
+    """Render an IN/NOT IN membership test as a Spring EL contains() call."""
+    bang = '!' if negate else ''
+    if isinstance(right_node, Literal) and right_node.value_type == 'list':
+        # List literals carry their prerendered, quoted contents
+        return f"{bang}{{{right_node.rendered}}}.contains({left})"
+    return f"{bang}{right}.contains({left})"
+
+
+def _convert_binary_op(expr: BinaryOp, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
     """Convert binary operation."""
-    left = _convert_expression(expr.left, context, mappings)
-    right = _convert_expression(expr.right, context, mappings)
+    left = _convert_expression(expr.left, context_prefix, mappings, cache)
+    right = _convert_expression(expr.right, context_prefix, mappings, cache)
     op = mappings.get(expr.operator, expr.operator)
+    op_upper = expr.operator.upper()
 
     # Special handling for LIKE
-    if expr.operator.upper() == 'LIKE':
+    if op_upper == 'LIKE':
         # Convert SQL LIKE to Spring EL regex
         if isinstance(expr.right, Literal) and expr.right.value_type == 'string':
-            pattern = expr.right.value.replace('%', '.*')
-            return f"{left} =~ '{pattern}'"
+            return f"{left} =~ '{_like_regex(expr.right.value)}'"
         else:
             return f"{left} {op} {right}"
 
-    # Special handling for IN
-    if expr.operator.upper() == 'IN':
-        if isinstance(expr.right, Literal) and expr.right.value_type == 'list':
-            # Convert list items to properly quoted Spring EL set
-            items = []
-            for item in expr.right.value:
-                if isinstance(item, str):
-                    items.append(f"'{item}'")
-                else:
-                    items.append(str(item))
-            return f"{{{', '.join(items)}}}.contains({left})"
-        else:
-            return f"{right}.contains({left})"
-
-    # Special handling for NOT IN
-    if expr.operator.upper() == 'NOT IN':
-        if isinstance(expr.right, Literal) and expr.right.value_type == 'list':
-            # Convert list items to properly quoted Spring EL set
-            items = []
-            for item in expr.right.value:
-                if isinstance(item, str):
-                    items.append(f"'{item}'")
-                else:
-                    items.append(str(item))
-            return f"!{{{', '.join(items)}}}.contains({left})"
-        else:
-            return f"!{right}.contains({left})"
+    # Special handling for IN / NOT IN
+    if op_upper == 'IN':
+        return _render_contains(expr.right, left, right, negate=False)
+    if op_upper == 'NOT IN':
+        return _render_contains(expr.right, left, right, negate=True)
 
-    # Add parentheses for compound conditions
-    if expr.operator.upper() in ['AND', 'OR']:
-        return f"({left}) {op} ({right})"
+    # Parenthesize compound operands only when a lower-precedence child
+    # would otherwise change meaning (e.g. an OR under an AND)
+    if op_upper in ('AND', 'OR'):
+        prec = _PRECEDENCE[op_upper]
+        left = _logical_operand(expr.left, left, prec)
+        right = _logical_operand(expr.right, right, prec)
+        return f"{left} {op} {right}"
 
     return f"{left} {op} {right}"
 
 
-def _convert_unary_op(expr: UnaryOp, context: str, mappings: Dict[str, str]) -> str:
+def _convert_between_op(expr: BetweenOp, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
+    """Convert range check to the expanded compound comparison."""
+    left = _convert_expression(expr.left, context_prefix, mappings, cache)
+    low = _convert_expression(expr.low, context_prefix, mappings, cache)
+    high = _convert_expression(expr.high, context_prefix, mappings, cache)
+
+    return f"{left} >= {low} && {left} <= {high}"
+
+
+def _convert_unary_op(expr: UnaryOp, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
     """Convert unary operation."""
-    operand = _convert_expression(expr.operand, context, mappings)
+    operand = _convert_expression(expr.operand, context_prefix, mappings, cache)
     op = mappings.get(expr.operator, expr.operator)
+    op_upper = expr.operator.upper()
 
-    if expr.operator.upper() == 'NOT':
+    if op_upper == 'NOT':
         # For NOT operations, wrap complex expressions in parentheses to ensure proper precedence
-        if isinstance(expr.operand, BinaryOp) or '&&' in operand or '||' in operand or '==' in operand or '!=' in operand:
+        if isinstance(expr.operand, BinaryOp) or any(tok in operand for tok in _NOT_PAREN_TOKENS):
             return f"{op}({operand})"
         else:
             return f"{op}{operand}"
-    elif expr.operator.upper() == 'IS NULL':
+    elif op_upper == 'IS NULL':
         return f"{operand} == null"
-    elif expr.operator.upper() == 'IS NOT NULL':
+    elif op_upper == 'IS NOT NULL':
         return f"{operand} != null"
     else:
         return f"{op} {operand}"
 
 
-def _convert_function_call(expr: FunctionCall, context: str, mappings: Dict[str, str]) -> str:
+def _convert_function_call(expr: FunctionCall, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
     """Convert function call."""
-    args = [_convert_expression(arg, context, mappings) for arg in expr.arguments]
+    args = [_convert_expression(arg, context_prefix, mappings, cache) for arg in expr.arguments]
+    name_upper = expr.name.upper()
 
-    if expr.name.upper() == 'ISNULL':
+    if name_upper == 'ISNULL':
         if len(args) == 2:
             return f"{args[0]} ?: {args[1]}"
         else:
             return f"{args[0]} ?: null"
-    elif expr.name.upper() == 'COALESCE':
+    elif name_upper == 'COALESCE':
         return ' ?: '.join(args)
     else:
         # Generic function call
@@ -201,30 +296,43 @@ def _convert_function_call(expr: FunctionCall, context: str, mappings: Dict[str,
         return f"{expr.name}({arg_str})"
 
 
-def _convert_literal(expr: Literal) -> str:
-    """Convert literal value."""
-    if expr.value_type == 'string':
-        return f"'{expr.value}'"
-    elif expr.value_type == 'boolean':
-        return str(expr.value).lower()
-    elif expr.value_type == 'null':
-        return 'null'
-    else:
-        return str(expr.value)
+# Rendered operators whose presence in a NOT operand forces parenthesization
+_NOT_PAREN_TOKENS = ('&&', '||', '==', '!=')
 
+# Logical operator precedence; comparisons and everything else bind
+# tighter than AND/OR so they never need wrapping.
+_PRECEDENCE = {'OR': 1, 'AND': 2}
 
-def _convert_variable(expr: Variable, context: str) -> str:
-    """Convert variable/column."""
-    # Special handling for CASE expressions stored as Variables
-    if expr.name.upper().startswith('CASE ') and expr.name.upper().endswith(' END'):
-        # Parse and convert CASE expression to Spring EL ternary operators
-        return _convert_case_expression(expr.name, context)
 
+def _logical_operand(child: Expression, rendered: str, parent_prec: int) -> str:
+    """Wrap a rendered AND/OR operand in parens only when precedence requires it."""
+    if isinstance(child, BinaryOp):
+        if _PRECEDENCE.get(child.operator.upper(), 10) < parent_prec:
+            return f"({rendered})"
+    return rendered
+
+
+# Per-value_type renderers; the default (numbers and anything unrecognized)
+# falls through to str.
+_LITERAL_HANDLERS = {
+    'string': lambda value: f"'{value}'",
+    'boolean': lambda value: 'true' if value else 'false',
+    'null': lambda value: 'null',
+}
+
+
+def _convert_literal(expr: Literal, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
+    """Convert literal value (context/mappings unused, kept for uniform dispatch)."""
+    return _LITERAL_HANDLERS.get(expr.value_type, str)(expr.value)
+
+
+def _convert_variable(expr: Variable, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
+    """Convert variable/column (mappings unused, kept for uniform dispatch)."""
     # Clean up bracket identifiers for Spring EL
-    clean_name = _clean_identifier(expr.name)
-    return f"{context}.{clean_name}"
+    return context_prefix + _clean_identifier(expr.name)
 
 
+@lru_cache(maxsize=4096)
 def _clean_identifier(identifier: str) -> str:
     """
     Clean SQL identifiers for Spring EL property access.
@@ -262,10 +370,16 @@ def _clean_identifier(identifier: str) -> str:
         return cleaned
 
 
+# Hyphen runs plus the following character (if any); used to camelCase
+# lowered identifiers in one C-level substitution pass
+_HYPHEN_RE = re.compile(r'-+([a-z0-9])?')
+
+
+@lru_cache(maxsize=2048)
 def _to_camel_case(text: str) -> str:
     """
     Convert hyphenated text to camelCase.
-    
+
     Examples:
         user-profile -> userProfile
         age-group -> ageGroup
@@ -274,151 +388,38 @@ def _to_camel_case(text: str) -> str:
     """
     if '-' not in text:
         return text
-    
-    parts = text.split('-')
-    # First part stays lowercase, subsequent parts are capitalized
-    camel_case = parts[0].lower()
-    for part in parts[1:]:
-        if part:  # Handle double hyphens or trailing hyphens
-            camel_case += part.capitalize()
-    
-    return camel_case
-
-
-def _convert_conditional(expr: Conditional, context: str, mappings: Dict[str, str]) -> str:
-    """Convert conditional (CASE) expression."""
-    condition = _convert_expression(expr.condition, context, mappings)
-    then_part = _convert_expression(expr.then_expr, context, mappings)
-    else_part = _convert_expression(expr.else_expr, context, mappings)
 
-    return f"{condition} ? {then_part} : {else_part}"
+    # Lower first so segment tails match the old capitalize() behavior,
+    # then uppercase the character following each hyphen run
+    return _HYPHEN_RE.sub(
+        lambda m: m.group(1).upper() if m.group(1) else '',
+        text.lower()
+    )
 
 
-def _convert_case_expression(case_sql: str, context: str) -> str:
-    """
-    Convert a CASE SQL expression to Spring EL ternary operators.
-    
-    Converts: CASE WHEN condition1 THEN value1 WHEN condition2 THEN value2 ELSE value3 END
-    To: condition1 ? value1 : (condition2 ? value2 : value3)
-    """
-    import re
-    
-    # Remove CASE and END keywords
-    case_sql = case_sql.strip()
-    if case_sql.upper().startswith('CASE '):
-        case_sql = case_sql[5:].strip()
-    if case_sql.upper().endswith(' END'):
-        case_sql = case_sql[:-4].strip()
-    
-    # Parse WHEN...THEN pairs and ELSE clause with nested CASE support
-    when_clauses = []
-    else_clause = None
-    
-    # Use a more sophisticated parser that handles nested CASE statements
-    remaining = case_sql
-    
-    while remaining:
-        # Find the next WHEN
-        when_match = re.search(r'\bWHEN\s+', remaining, re.IGNORECASE)
-        if not when_match:
-            break
-            
-        # Extract everything from WHEN onwards
-        when_start = when_match.start()
-        when_content = remaining[when_start + len(when_match.group()):]
-        
-        # Find the corresponding THEN
-        then_match = re.search(r'\bTHEN\s+', when_content, re.IGNORECASE)
-        if not then_match:
-            break
-            
-        # Extract condition (between WHEN and THEN)
-        condition = when_content[:then_match.start()].strip()
-        
-        # Find the next WHEN or ELSE, accounting for nested CASE statements
-        rest_content = when_content[then_match.end():]
-        
-        # Parse the THEN value, which might contain nested CASE statements
-        then_value, remaining_after_then = _extract_then_value_with_nesting(rest_content)
-        
-        when_clauses.append((condition, then_value))
-        
-        # Check if we found an ELSE clause
-        if remaining_after_then.strip().upper().startswith('ELSE '):
-            else_clause = remaining_after_then[5:].strip()
-            break
-        elif remaining_after_then.strip().upper().startswith('WHEN '):
-            remaining = remaining_after_then
-        else:
-            break
-    
-    if not when_clauses:
-        return "'CASE_PARSE_ERROR'"
-    
-    # Convert to nested ternary operators
-    # Handle else clause - parse it like then values
-    if else_clause:
-        if else_clause.strip().upper().startswith('CASE '):
-            # Recursively convert nested CASE statement
-            result = _convert_case_expression(else_clause, context)
-        elif else_clause.startswith("'") and else_clause.endswith("'"):
-            result = else_clause  # Keep as-is for single-quoted strings
-        elif else_clause.startswith('"') and else_clause.endswith('"'):
-            # Convert double quotes to single quotes
-            result = f"'{else_clause[1:-1]}'"
-        else:
-            # Try to parse as expression, fallback to literal
-            try:
-                from mssql_to_spring_el.parser import _parse_simple_expression
-                else_expr = _parse_simple_expression(else_clause)
-                result = _convert_expression(else_expr, context, _get_default_mappings())
-            except:
-                result = f"'{else_clause}'"  # Treat as string literal
-    else:
-        result = 'null'
-    
-    # Build from right to left (last WHEN clause first)
-    for condition, then_value in reversed(when_clauses):
-        # Convert condition and value to Spring EL
-        try:
-            # Parse the condition as a simple expression
-            from mssql_to_spring_el.parser import _parse_simple_expression
-            from mssql_to_spring_el.converter import _convert_expression, _get_default_mappings
-            
-            condition_expr = _parse_simple_expression(condition)
-            condition_el = _convert_expression(condition_expr, context, _get_default_mappings())
-            
-            # Handle then_value which might contain nested CASE statements
-            if then_value.strip().upper().startswith('CASE '):
-                # Recursively convert nested CASE statement
-                then_el = _convert_case_expression(then_value, context)
-            elif then_value.startswith("'") and then_value.endswith("'"):
-                then_el = then_value  # Keep as-is for single-quoted strings
-            elif then_value.startswith('"') and then_value.endswith('"'):
-                # Convert double quotes to single quotes
-                then_el = f"'{then_value[1:-1]}'"
-            else:
-                # Try to parse as expression, fallback to literal
-                try:
-                    then_expr = _parse_simple_expression(then_value)
-                    then_el = _convert_expression(then_expr, context, _get_default_mappings())
-                except:
-                    then_el = f"'{then_value}'"  # Treat as string literal
-            
-            # Handle else clause similarly
-            if result != 'null' and not result.startswith("'") and not result.startswith("("):
-                if not any(op in result for op in ['?', '&&', '||', '==', '!=', '>', '<', '>=', '<=']):
-                    result = f"'{result}'"
-            
-            result = f"({condition_el} ? {then_el} : {result})"
-            
-        except Exception as e:
-            logger.warning(f"Failed to parse CASE condition '{condition}': {e}")
-            # Fallback to simple text replacement for variables
-            if ' ' not in condition and condition.isidentifier():
-                condition_el = f"{context}.{condition}"
-            else:
-                condition_el = f"/* PARSE_ERROR: {condition} */ true"
-            result = f"({condition_el} ? {then_value} : {result})"
-    
-    return result
+def _convert_conditional(expr: Conditional, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
+    """Convert conditional (CASE) expression."""
+    condition = _convert_expression(expr.condition, context_prefix, mappings, cache)
+    then_part = _convert_expression(expr.then_expr, context_prefix, mappings, cache)
+    else_part = _convert_expression(expr.else_expr, context_prefix, mappings, cache)
+
+    return f"({condition} ? {then_part} : {else_part})"
+
+
+def _convert_logical_group(expr: LogicalGroup, context_prefix: str, mappings: Dict[str, str], cache: Dict[int, str]) -> str:
+    """Convert parenthesized group."""
+    return f"({_convert_expression(expr.expression, context_prefix, mappings, cache)})"
+
+
+# Type-indexed dispatch table: one dict lookup on type(expr) replaces the
+# isinstance chain in the hot recursive conversion path.
+_DISPATCH = {
+    BinaryOp: _convert_binary_op,
+    BetweenOp: _convert_between_op,
+    UnaryOp: _convert_unary_op,
+    FunctionCall: _convert_function_call,
+    Literal: _convert_literal,
+    Variable: _convert_variable,
+    Conditional: _convert_conditional,
+    LogicalGroup: _convert_logical_group,
+}
@@ -5,12 +5,16 @@ This module defines the abstract syntax tree (AST) classes that represent
 parsed MSSQL logic expressions.
 """
 
+import sys
 from typing import Any, List, Dict
 
 
 class Expression:
     """Base class for all logic expression nodes."""
 
+    # Empty here so slotted subclasses stay dict-free
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -22,18 +26,36 @@ class Expression:
         return f"{self.__class__.__name__}()"
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, Expression):
+        if type(other) is not type(self):
             return False
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        """Structural hash consistent with __eq__, so equal trees collide.
+
+        List-valued fields (IN-list values, function arguments) are
+        hashed as tuples; everything else hashes recursively.
+        """
+        values = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, name) for name in self.__slots__)
+        )
+        return hash((type(self), values))
 
 
 class BinaryOp(Expression):
     """Represents binary operations like >, =, AND, etc."""
 
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left: Expression, operator: str, right: Expression):
         super().__init__()
         self.left = left
-        self.operator = operator
+        # Interned so converter comparisons hit the pointer-equality fast path
+        self.operator = sys.intern(operator)
         self.right = right
 
     def to_dict(self) -> Dict[str, Any]:
@@ -48,12 +70,37 @@ class BinaryOp(Expression):
         return f"BinaryOp({self.left!r}, {self.operator!r}, {self.right!r})"
 
 
+class BetweenOp(Expression):
+    """Represents range checks like column BETWEEN low AND high."""
+
+    __slots__ = ('left', 'low', 'high')
+
+    def __init__(self, left: Expression, low: Expression, high: Expression):
+        super().__init__()
+        self.left = left
+        self.low = low
+        self.high = high
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "BetweenOp",
+            "left": self.left.to_dict(),
+            "low": self.low.to_dict(),
+            "high": self.high.to_dict()
+        }
+
+    def __repr__(self) -> str:
+        return f"BetweenOp({self.left!r}, {self.low!r}, {self.high!r})"
+
+
 class UnaryOp(Expression):
     """Represents unary operations like NOT, IS NULL."""
 
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator: str, operand: Expression):
         super().__init__()
-        self.operator = operator
+        self.operator = sys.intern(operator)
         self.operand = operand
 
     def to_dict(self) -> Dict[str, Any]:
@@ -70,6 +117,8 @@ class UnaryOp(Expression):
 class FunctionCall(Expression):
     """Represents function calls like ISNULL(column, 'default')."""
 
+    __slots__ = ('name', 'arguments')
+
     def __init__(self, name: str, arguments: List[Expression]):
         super().__init__()
         self.name = name
@@ -89,10 +138,34 @@ class FunctionCall(Expression):
 class Literal(Expression):
     """Represents literal values like strings, numbers, booleans."""
 
+    __slots__ = ('value', 'value_type', 'rendered')
+
     def __init__(self, value: Any, value_type: str):
         super().__init__()
         self.value = value
-        self.value_type = value_type  # 'string', 'number', 'boolean'
+        self.value_type = sys.intern(value_type)  # 'string', 'number', 'boolean'
+        self.rendered = None
+        if self.value_type == 'list':
+            # Prerender list contents once so IN/NOT IN conversion is a
+            # plain concatenation instead of a per-call quote-and-join
+            self.rendered = ', '.join(
+                f"'{item}'" if isinstance(item, str) else str(item)
+                for item in value
+            )
+
+    def __eq__(self, other) -> bool:
+        # Python's == conflates 18 with 18.0 (and True with 1), but those
+        # render differently; structural equality must stay at least as
+        # fine-grained as rendering because it keys the converter's memo.
+        return (type(other) is Literal
+                and type(self.value) is type(other.value)
+                and self.value == other.value
+                and self.value_type == other.value_type
+                and self.rendered == other.rendered)
+
+    def __hash__(self) -> int:
+        value = tuple(self.value) if isinstance(self.value, list) else self.value
+        return hash((Literal, type(self.value), value, self.value_type, self.rendered))
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -108,6 +181,8 @@ class Literal(Expression):
 class Variable(Expression):
     """Represents column names or variables."""
 
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -125,6 +200,8 @@ class Variable(Expression):
 class Conditional(Expression):
     """Represents CASE/IIF expressions."""
 
+    __slots__ = ('condition', 'then_expr', 'else_expr')
+
     def __init__(self, condition: Expression, then_expr: Expression, else_expr: Expression):
         super().__init__()
         self.condition = condition
@@ -146,6 +223,8 @@ class Conditional(Expression):
 class LogicalGroup(Expression):
     """Represents grouped expressions with parentheses."""
 
+    __slots__ = ('expression',)
+
     def __init__(self, expression: Expression):
         super().__init__()
         self.expression = expression
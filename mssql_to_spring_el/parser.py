@@ -7,15 +7,98 @@ into abstract syntax tree (AST) objects defined in logic_models.py.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Optional
 from mssql_to_spring_el.logic_models import (
-    Expression, BinaryOp, UnaryOp, FunctionCall,
+    Expression, BinaryOp, BetweenOp, UnaryOp, FunctionCall,
     Literal, Variable, Conditional, LogicalGroup
 )
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns. parse_sql_logic runs many of these per call, so
+# compiling once at import keeps the hot path free of per-call pattern
+# parsing and re-cache lookups.
+_RE_STRINGS = re.compile(r"'[^']*'|\"[^\"]*\"")
+_RE_PLACEHOLDER_BEFORE = re.compile(r'(___STRING_LITERAL_\d+___)([A-Z]+)')
+_RE_PLACEHOLDER_AFTER = re.compile(r'([A-Z]+)(___STRING_LITERAL_\d+___)')
+_RE_PLACEHOLDER = re.compile(r'___STRING_LITERAL_(\d+)___')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_BETWEEN = re.compile(
+    r'^((?:\[?\w+(?:-\w+)*\]?\.)*\[?\w+(?:-\w+)*\]?)\s+BETWEEN\s+(.+?)\s+AND\s+(.+?)$',
+    re.IGNORECASE
+)
+_RE_FUNC_CALL = re.compile(r'^(\w+)\s*\((.*)\)$', re.DOTALL)
+
+# Valid bare identifier: word characters only, at least one of them not an
+# underscore (mirrors the old replace('_', '').isalnum() acceptance)
+_RE_IDENTIFIER = re.compile(r'\w*[^\W_]\w*')
+
+# Flyweight nodes for the common literals and recurring column names.
+# Parse results are documented as shared and immutable, so handing the
+# same node to every caller is safe and avoids an allocation per operand.
+_LITERAL_TRUE = Literal(True, "boolean")
+_LITERAL_FALSE = Literal(False, "boolean")
+_LITERAL_NULL = Literal(None, "null")
+
+_LITERAL_KEYWORDS = {
+    'true': _LITERAL_TRUE,
+    'false': _LITERAL_FALSE,
+    'null': _LITERAL_NULL,
+}
+
+_VARIABLE_INTERN = {}
+_VARIABLE_INTERN_MAX = 1024
+
+
+def _intern_variable(name: str) -> Variable:
+    """Return a shared Variable node for name, capping the intern table."""
+    var = _VARIABLE_INTERN.get(name)
+    if var is None:
+        if len(_VARIABLE_INTERN) >= _VARIABLE_INTERN_MAX:
+            _VARIABLE_INTERN.clear()
+        var = Variable(name)
+        _VARIABLE_INTERN[name] = var
+    return var
+
+# Fast path for the most common clause shape: bare 'operand OP operand'
+# comparisons whose operands carry no quotes, parens or spaces. Operator
+# characters are excluded from the operand class so unspaced forms like
+# [x].[y]>=5 split at the full operator instead of backtracking into it.
+_RE_FAST_COMPARISON = re.compile(
+    r"([^\s()'\"<>=!]+)\s*(>=|<=|!=|<>|=|>|<)\s*([^\s()'\"<>=!]+)"
+)
+
+# Leftmost comparison operator, searched against the uppercased SQL.
+# Two-character operators precede their one-character prefixes so that
+# alternation order resolves >= before = at the same position.
+_RE_COMPARISON_OP = re.compile(r'>=|<=|!=|<>|=|>|<| LIKE | IN | IS ')
+
+# Operator-spacing fixes applied by _normalize_whitespace.
+# All comparison operators share one alternation; the trailing word
+# character is a lookahead rather than a consumed group so that chained
+# operators (a>=b>=c) are fixed in a single left-to-right pass.
+_RE_COMPARISON_FIX = re.compile(r'(\w)(>=|<=|!=|<>|=|>|<)(?=\w)')
+_RE_OPERATOR_FIXES = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in [
+        (r'(\w)IN\s*\(', r'\1 IN ('),  # statusIN( -> status IN (
+        (r'(\w)NOT\s+IN\s*\(', r'\1 NOT IN ('),  # statusNOT IN( -> status NOT IN (
+        # Handle numbers followed by AND/OR only when clearly separate tokens
+        (r'(\d+)\s*AND\s*(\w)', r'\1 AND \2'),      # 18AND -> 18 AND
+        (r'(\d+)\s*OR\s*(\w)', r'\1 OR \2'),        # 18OR -> 18 OR
+        (r'(\w)\s*AND\s*(\()', r'\1 AND \2'),       # status AND( -> status AND (
+        (r'(\w)\s*OR\s*(\()', r'\1 OR \2'),         # status OR( -> status OR (
+    ]
+]
+
+# Critical logical operators whose surrounding whitespace is canonicalized
+_RE_KEY_OPERATORS = [
+    (re.compile(r'\s+AND\s+', re.IGNORECASE), ' AND '),
+    (re.compile(r'\s+OR\s+', re.IGNORECASE), ' OR '),
+]
+
 
 def _is_numeric_literal(operand: str) -> bool:
     """
@@ -56,12 +139,12 @@ def _normalize_whitespace(sql: str) -> str:
         return placeholder_pattern.format(len(string_literals) - 1)
     
     # Replace strings with placeholders (both single and double quotes)
-    sql_with_placeholders = re.sub(r"'[^']*'|\"[^\"]*\"", replace_string, sql)
-    
+    sql_with_placeholders = _RE_STRINGS.sub(replace_string, sql)
+
     # Basic operator spacing will be handled later in the function
     # But handle string literal + operator cases that need immediate attention
-    sql_with_placeholders = re.sub(r'(___STRING_LITERAL_\d+___)([A-Z]+)', r'\1 \2', sql_with_placeholders)
-    sql_with_placeholders = re.sub(r'([A-Z]+)(___STRING_LITERAL_\d+___)', r'\1 \2', sql_with_placeholders)
+    sql_with_placeholders = _RE_PLACEHOLDER_BEFORE.sub(r'\1 \2', sql_with_placeholders)
+    sql_with_placeholders = _RE_PLACEHOLDER_AFTER.sub(r'\1 \2', sql_with_placeholders)
     
     # Normalize whitespace in non-string portions
     # Convert tabs to spaces
@@ -70,51 +153,40 @@ def _normalize_whitespace(sql: str) -> str:
     # Convert newlines to spaces
     normalized = normalized.replace('\n', ' ').replace('\r', ' ')
     
-    # Add spaces around operators that might be missing them (minimal spacing fix)
-    # Apply patterns multiple times to handle cascading fixes
-    for _ in range(3):  # Multiple passes to handle complex cases
-        operator_patterns = [
-            # Comparison operators first
-            (r'(\w)>=(\w)', r'\1 >= \2'),  # age>=18 -> age >= 18
-            (r'(\w)<=(\w)', r'\1 <= \2'),  # age<=65 -> age <= 65  
-            (r'(\w)!=(\w)', r'\1 != \2'),  # id!=0 -> id != 0
-            (r'(\w)<>(\w)', r'\1 <> \2'),  # id<>0 -> id <> 0
-            (r'(\w)=(\w)', r'\1 = \2'),    # status=active -> status = active (but be careful with strings)
-            (r'(\w)>(\w)', r'\1 > \2'),    # age>18 -> age > 18
-            (r'(\w)<(\w)', r'\1 < \2'),    # age<65 -> age < 65
-            (r'(\w)IN\s*\(', r'\1 IN ('),  # statusIN( -> status IN (
-            (r'(\w)NOT\s+IN\s*\(', r'\1 NOT IN ('),  # statusNOT IN( -> status NOT IN (
-            # Handle numbers followed by AND/OR only when clearly separate tokens
-            (r'(\d+)\s*AND\s*(\w)', r'\1 AND \2'),      # 18AND -> 18 AND  
-            (r'(\d+)\s*OR\s*(\w)', r'\1 OR \2'),        # 18OR -> 18 OR
-            (r'(\w)\s*AND\s*(\()', r'\1 AND \2'),       # status AND( -> status AND (
-            (r'(\w)\s*OR\s*(\()', r'\1 OR \2'),         # status OR( -> status OR (
-        ]
-        
-        for pattern, replacement in operator_patterns:
-            normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
-    
+    # Add spaces around operators that might be missing them (minimal
+    # spacing fix). The comparison fix runs first so that the word-operator
+    # fixes below see already-separated tokens; one pass over each pattern
+    # suffices now that chained comparisons are handled by lookahead.
+    normalized = _RE_COMPARISON_FIX.sub(r'\1 \2 ', normalized)
+    for pattern, replacement in _RE_OPERATOR_FIXES:
+        normalized = pattern.sub(replacement, normalized)
+
     # Collapse multiple spaces to single space
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
+    normalized = _RE_WHITESPACE.sub(' ', normalized)
+
     # Ensure proper spacing around key operators (be more selective)
-    key_operators = [' AND ', ' OR ']
-    for op in key_operators:
-        # Ensure these critical operators have proper spacing
-        pattern = op.strip()
-        normalized = re.sub(rf'\s+{re.escape(pattern)}\s+', f' {pattern} ', normalized, flags=re.IGNORECASE)
-    
-    # Restore string literals
-    for i, literal in enumerate(string_literals):
-        normalized = normalized.replace(placeholder_pattern.format(i), literal)
+    for pattern, replacement in _RE_KEY_OPERATORS:
+        normalized = pattern.sub(replacement, normalized)
     
+    # Restore string literals in one indexed pass; a replace() per literal
+    # would rescan the whole string for every placeholder
+    if string_literals:
+        normalized = _RE_PLACEHOLDER.sub(
+            lambda match: string_literals[int(match.group(1))], normalized
+        )
+
     return normalized.strip()
 
 
+@lru_cache(maxsize=4096)
 def parse_sql_logic(sql_string: str) -> Expression:
     """
     Parse MSSQL logical expression into object model.
 
+    Results are memoized per input string, so identical expressions parse
+    once and then return O(1). The returned AST is shared between callers
+    and must be treated as immutable.
+
     Args:
         sql_string: MSSQL logic string (e.g., "WHERE age > 18 AND status = 'active'")
 
@@ -129,30 +201,44 @@ def parse_sql_logic(sql_string: str) -> Expression:
         logger.error("Empty SQL expression provided")
         raise ValueError("Empty SQL expression")
 
-    logger.debug(f"Parsing SQL expression: {sql_string}")
+    logger.debug("Parsing SQL expression: %s", sql_string)
 
     # NEW: Normalize whitespace first, before any processing
     sql_string = _normalize_whitespace(sql_string)
-    logger.debug(f"Normalized whitespace: {sql_string}")
+    logger.debug("Normalized whitespace: %s", sql_string)
 
     # Remove WHERE/HAVING prefix if present
     sql_string = sql_string.strip()
     original_sql = sql_string
     if sql_string.upper().startswith('WHERE '):
         sql_string = sql_string[6:].strip()
-        logger.debug(f"Removed WHERE prefix, parsing: {sql_string}")
+        logger.debug("Removed WHERE prefix, parsing: %s", sql_string)
     elif sql_string.upper().startswith('HAVING '):
         sql_string = sql_string[7:].strip()
-        logger.debug(f"Removed HAVING prefix, parsing: {sql_string}")
+        logger.debug("Removed HAVING prefix, parsing: %s", sql_string)
 
     # Handle CASE expressions
     if sql_string.upper().startswith('CASE '):
         logger.debug("Detected CASE expression")
         return _parse_expression_with_case(sql_string)
 
+    # Fast path: a bare comparison with simple operands skips validation
+    # and the full expression scan; anything it cannot classify falls
+    # through to the general parser below
+    fast_match = _RE_FAST_COMPARISON.fullmatch(sql_string)
+    if fast_match:
+        try:
+            return BinaryOp(
+                _parse_operand(fast_match.group(1)),
+                fast_match.group(2),
+                _parse_operand(fast_match.group(3))
+            )
+        except ValueError:
+            pass
+
     # Basic validation
     if not _is_valid_sql_expression(sql_string):
-        logger.error(f"Invalid SQL expression: {sql_string}")
+        logger.error("Invalid SQL expression: %s", sql_string)
         raise ValueError(f"Invalid SQL expression: {sql_string}")
 
     # For now, implement a simple parser for basic expressions
@@ -162,51 +248,79 @@ def parse_sql_logic(sql_string: str) -> Expression:
     return _parse_simple_expression(sql_string)
 
 
+def clear_parse_cache() -> None:
+    """Clear the memoized parse_sql_logic results (mainly for tests)."""
+    parse_sql_logic.cache_clear()
+
+
+def parse_sql_logic_many(sql_strings) -> list:
+    """
+    Parse a sequence of MSSQL logic strings into a list of Expressions.
+
+    Bulk companion to parse_sql_logic for callers converting whole rule
+    sets: duplicate strings are served from the parse cache, so only the
+    distinct expressions in the batch pay for parsing.
+
+    Args:
+        sql_strings: Iterable of MSSQL logic strings
+
+    Returns:
+        List of Expression objects, in input order
+
+    Raises:
+        ValueError: If any SQL syntax is invalid or unsupported
+        NotImplementedError: If a feature is not yet implemented
+    """
+    return [parse_sql_logic(sql) for sql in sql_strings]
+
+
+@lru_cache(maxsize=4096)
 def _parse_simple_expression(sql: str) -> Expression:
-    """Parse simple expressions (placeholder implementation)."""
+    """Parse simple expressions (placeholder implementation).
+
+    Memoized per substring: the AND/OR recursion re-enters this function
+    with rejoined tails and repeated subterms, and the cache turns that
+    re-walking into lookups. Shares the immutability contract of
+    parse_sql_logic's cache.
+    """
     sql = sql.strip()
     original_sql = sql  # Keep original for case preservation
+    # Uppercase once; every case-insensitive check below reuses this
+    sql_upper = sql.upper()
 
     # Check for unsupported operators first
     unsupported_ops = [' MOD ', ' DIV ', ' % ', ' ^ ', ' & ', ' | ', ' << ', ' >> ']
     for op in unsupported_ops:
-        if op in sql.upper():
+        if op in sql_upper:
             raise NotImplementedError(f"Operator '{op.strip()}' is not supported")
 
-    # Handle parentheses - but only if they wrap the entire expression
-    if sql.startswith('(') and sql.endswith(')'):
-        # Check if these parentheses actually wrap the entire expression
-        # by ensuring the closing paren matches the opening paren
-        paren_count = 0
-        for i, char in enumerate(sql):
-            if char == '(':
-                paren_count += 1
-            elif char == ')':
-                paren_count -= 1
-                # If we reach 0 before the end, the parentheses don't wrap everything
-                if paren_count == 0 and i < len(sql) - 1:
-                    break
-        
-        # Only treat as wrapped expression if parentheses balance at the very end
-        if paren_count == 0 and i == len(sql) - 1:
-            inner = _parse_simple_expression(sql[1:-1])
-            # If the inner expression is already a BinaryOp, don't wrap it in LogicalGroup
-            if isinstance(inner, BinaryOp):
-                return inner
-            else:
-                return LogicalGroup(inner)
+    # Handle parentheses - but only if they wrap the entire expression.
+    # Strip every balanced outer layer here in one loop; recursing once
+    # per layer would re-run the whole branch ladder for each shell.
+    wrap_layers = 0
+    while sql.startswith('(') and sql.endswith(')') and _parens_wrap_entire(sql):
+        sql = sql[1:-1].strip()
+        wrap_layers += 1
+    if wrap_layers:
+        inner = _parse_simple_expression(sql)
+        # If the inner expression is already a BinaryOp, don't wrap it in
+        # LogicalGroup; otherwise rewrap one group per stripped layer
+        if isinstance(inner, BinaryOp):
+            return inner
+        for _ in range(wrap_layers):
+            inner = LogicalGroup(inner)
+        return inner
 
     # Handle NOT operations
-    if sql.upper().startswith('NOT '):
+    if sql_upper.startswith('NOT '):
         operand = _parse_simple_expression(sql[4:].strip())
         return UnaryOp('NOT', operand)
 
     # Handle BETWEEN specially (before AND/OR to avoid splitting issues)
     # Support table-qualified identifiers in BETWEEN expressions
-    between_match = re.match(r'^((?:\[?\w+(?:-\w+)*\]?\.)*\[?\w+(?:-\w+)*\]?)\s+BETWEEN\s+(.+?)\s+AND\s+(.+?)$', sql, re.IGNORECASE)
+    between_match = _RE_BETWEEN.match(sql)
     if between_match:
         # Check if there are other operators besides the BETWEEN AND
-        sql_upper = sql.upper()
         has_other_ops = False
         for op in [' AND ', ' OR ', ' NOT ', ' LIKE ', ' IN ', ' IS ']:
             if op in sql_upper:
@@ -230,27 +344,30 @@ def _parse_simple_expression(sql: str) -> Expression:
             left = _parse_operand(left_part)
             min_val = _parse_operand(middle_part)
             max_val = _parse_operand(right_part)
-            
-            # Create a compound expression: left >= min_val AND left <= max_val
-            left_gte_min = BinaryOp(left, '>=', min_val)
-            left_lte_max = BinaryOp(left, '<=', max_val)
-            return BinaryOp(left_gte_min, 'AND', left_lte_max)
 
-    # Handle AND/OR operations (simple split)
+            # One range node instead of the AND-of->=/<= triple; the
+            # converter expands it back to the compound comparison
+            return BetweenOp(left, min_val, max_val)
+
+    # Handle AND/OR operations (simple split). Each part is parsed once and
+    # folded with a loop; re-joining the tail and recursing would re-scan
+    # the shrinking string for every operator in the chain.
     and_parts = _split_by_operator(sql, ' AND ')
     if len(and_parts) > 1:
-        left = _parse_simple_expression(and_parts[0])
-        right = _parse_simple_expression(' AND '.join(and_parts[1:]))
-        return BinaryOp(left, 'AND', right)
+        node = _parse_simple_expression(and_parts[0])
+        for part in and_parts[1:]:
+            node = BinaryOp(node, 'AND', _parse_simple_expression(part))
+        return node
 
     or_parts = _split_by_operator(sql, ' OR ')
     if len(or_parts) > 1:
-        left = _parse_simple_expression(or_parts[0])
-        right = _parse_simple_expression(' OR '.join(or_parts[1:]))
-        return BinaryOp(left, 'OR', right)
+        node = _parse_simple_expression(or_parts[0])
+        for part in or_parts[1:]:
+            node = BinaryOp(node, 'OR', _parse_simple_expression(part))
+        return node
 
     # Handle function calls in operands  
-    func_match = re.match(r'^(\w+)\s*\((.*)\)$', sql.strip(), re.DOTALL)
+    func_match = _RE_FUNC_CALL.match(sql.strip())
     if func_match:
         func_name = func_match.group(1)
         args_str = func_match.group(2).strip()
@@ -261,17 +378,58 @@ def _parse_simple_expression(sql: str) -> Expression:
             args = []
         return FunctionCall(func_name, args)
     
-    # Handle NOT IN operator specially
-    if ' NOT IN ' in sql.upper():
-        parts = sql.upper().split(' NOT IN ')
-        if len(parts) == 2:
-            left_str = sql.split(' NOT IN ')[0].strip()
-            right_str = sql.split(' NOT IN ')[1].strip()
-            left = _parse_operand(left_str)
-            
-            # Special handling for NOT IN lists
+    # Handle NOT IN operator specially. Each special branch locates its
+    # keyword with one find against the prebuilt sql_upper and slices the
+    # original string, instead of splitting both strings separately.
+    pos = sql_upper.find(' NOT IN ')
+    if pos != -1 and sql_upper.find(' NOT IN ', pos + 8) == -1:
+        left = _parse_operand(sql[:pos].strip())
+        right_str = sql[pos + 8:].strip()
+
+        # Special handling for NOT IN lists
+        if right_str.startswith('(') and right_str.endswith(')'):
+            # Parse NOT IN list
+            list_content = right_str[1:-1].strip()
+            if list_content:
+                items = _parse_comma_separated_list(list_content)
+                right = Literal(items, "list")
+            else:
+                right = Literal([], "list")
+        else:
+            right = _parse_operand(right_str)
+
+        return BinaryOp(left, 'NOT IN', right)
+
+    # Handle NOT LIKE specially
+    pos = sql_upper.find(' NOT LIKE ')
+    if pos != -1 and sql_upper.find(' NOT LIKE ', pos + 10) == -1:
+        left = _parse_operand(sql[:pos].strip())
+        right = _parse_operand(sql[pos + 10:].strip())
+        return BinaryOp(UnaryOp('NOT', left), 'LIKE', right)
+
+    # Handle IS NULL and IS NOT NULL operators
+    pos = sql_upper.find(' IS NOT NULL')
+    if pos != -1 and sql_upper[pos + 12:].strip() == '':  # Ensure nothing after
+        left = _parse_operand(sql[:pos].strip())
+        return UnaryOp('IS NOT NULL', left)
+
+    pos = sql_upper.find(' IS NULL')
+    if pos != -1 and sql_upper[pos + 8:].strip() == '':  # Ensure nothing after
+        left = _parse_operand(sql[:pos].strip())
+        return UnaryOp('IS NULL', left)
+
+    # Handle comparisons: one search over the uppercased SQL finds the
+    # leftmost operator instead of testing all ten operators in turn
+    cmp_match = _RE_COMPARISON_OP.search(sql_upper)
+    if cmp_match:
+        op = cmp_match.group().strip()
+        left = _parse_operand(sql[:cmp_match.start()].strip())
+        right_str = sql[cmp_match.end():].strip()
+
+        # Special handling for IN lists
+        if op == 'IN':
             if right_str.startswith('(') and right_str.endswith(')'):
-                # Parse NOT IN list
+                # Parse IN list
                 list_content = right_str[1:-1].strip()
                 if list_content:
                     items = _parse_comma_separated_list(list_content)
@@ -280,191 +438,163 @@ def _parse_simple_expression(sql: str) -> Expression:
                     right = Literal([], "list")
             else:
                 right = _parse_operand(right_str)
-            
-            return BinaryOp(left, 'NOT IN', right)
-
-    comparison_ops = ['>=', '<=', '!=', '<>', '=', '>', '<', ' LIKE ', ' IN ', ' IS ']
-
-    # Handle NOT LIKE specially
-    if ' NOT LIKE ' in sql.upper():
-        parts = sql.upper().split(' NOT LIKE ')
-        if len(parts) == 2:
-            left = _parse_operand(parts[0].strip())
-            right_str = sql.split(' NOT LIKE ')[1].strip()
+        else:
             right = _parse_operand(right_str)
-            return BinaryOp(UnaryOp('NOT', left), 'LIKE', right)
 
-    # Handle IS NULL and IS NOT NULL operators
-    if ' IS NOT NULL' in sql.upper():
-        parts = sql.upper().split(' IS NOT NULL')
-        if len(parts) == 2 and parts[1].strip() == '':  # Ensure nothing after
-            left_str = sql.split(' IS NOT NULL')[0].strip()
-            left = _parse_operand(left_str)
-            return UnaryOp('IS NOT NULL', left)
-    
-    if ' IS NULL' in sql.upper():
-        parts = sql.upper().split(' IS NULL')
-        if len(parts) == 2 and parts[1].strip() == '':  # Ensure nothing after
-            left_str = sql.split(' IS NULL')[0].strip()
-            left = _parse_operand(left_str)
-            return UnaryOp('IS NULL', left)
-
-    # Handle comparisons
-    comparison_ops = ['>=', '<=', '!=', '<>', '=', '>', '<', ' LIKE ', ' IN ', ' IS ']
-    for op in comparison_ops:
-        if op in sql.upper():
-            # Split on the operator with proper case handling
-            # For spaced operators like ' IN ', split on the original spaces to avoid false matches
-            if op.startswith(' ') and op.endswith(' '):
-                # Find the operator in the original SQL (preserving case)
-                op_upper = op.upper()
-                sql_upper = sql.upper()
-                op_pos = sql_upper.find(op_upper)
-                if op_pos != -1:
-                    left_part = sql[:op_pos]
-                    right_part = sql[op_pos + len(op):]
-                    parts = [left_part, right_part]
-                else:
-                    continue
-            else:
-                parts = sql.split(op.strip())  # For non-spaced operators
-                
-            if len(parts) == 2:
-                left = _parse_operand(parts[0].strip())
-                right_str = parts[1].strip()
-
-                # Special handling for IN lists
-                if op.strip().upper() == 'IN':
-                    if right_str.startswith('(') and right_str.endswith(')'):
-                        # Parse IN list
-                        list_content = right_str[1:-1].strip()
-                        if list_content:
-                            items = _parse_comma_separated_list(list_content)
-                            right = Literal(items, "list")
-                        else:
-                            right = Literal([], "list")
-                    else:
-                        right = _parse_operand(right_str)
-                else:
-                    right = _parse_operand(right_str)
-
-                return BinaryOp(left, op.strip(), right)
+        return BinaryOp(left, op, right)
 
     # Handle single operands
     return _parse_operand(sql)
 
 
+# One list item: any run of non-comma text where quoted spans (which may
+# themselves contain commas) count as single units
+_RE_LIST_ITEM = re.compile(r"(?:[^,'\"]|'[^']*'|\"[^\"]*\")+")
+
+# Tokens _split_args has to react to: quoted spans, parens, commas
+_RE_ARG_SCAN = re.compile(r"'[^']*'|\"[^\"]*\"|[(),]")
+
+
+def _split_args(args_str: str) -> list:
+    """
+    Split a function argument string on top-level commas only.
+
+    Commas inside nested function calls or quoted strings are not
+    argument separators; the quotes are kept on each part so the operand
+    parser still sees string literals as such.
+    """
+    parts = []
+    last = 0
+    depth = 0
+    for match in _RE_ARG_SCAN.finditer(args_str):
+        token = match.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif token == ',' and depth == 0:
+            parts.append(args_str[last:match.start()])
+            last = match.end()
+    parts.append(args_str[last:])
+    return parts
+
+
+def _parens_wrap_entire(sql: str) -> bool:
+    """True if the opening paren at position 0 closes at the last index."""
+    depth = 0
+    last = len(sql) - 1
+    for i, char in enumerate(sql):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return i == last
+    return False
+
+
 def _parse_comma_separated_list(content: str) -> list:
     """Parse a comma-separated list respecting quotes."""
     items = []
-    current = ""
-    in_string = False
-    string_char = None
-    
-    i = 0
-    while i < len(content):
-        char = content[i]
-        
-        if char in ["'", '"'] and not in_string:
-            # Start of quoted string
-            in_string = True
-            string_char = char
-            current += char
-        elif char == string_char and in_string:
-            # End of quoted string
-            in_string = False
-            string_char = None
-            current += char
-        elif in_string:
-            # Inside quoted string
-            current += char
-        elif char == ',' and not in_string:
-            # Comma outside quotes - end of item
-            if current.strip():
-                items.append(current.strip().strip("'\""))
-            current = ""
-        else:
-            current += char
-        i += 1
-    
-    # Add final item
-    if current.strip():
-        items.append(current.strip().strip("'\""))
-    
+    for match in _RE_LIST_ITEM.findall(content):
+        item = match.strip()
+        if item:
+            items.append(item.strip("'\""))
     return items
 
 
+# Compiled scan patterns for _split_by_operator, keyed by operator. Each
+# pattern matches everything the split has to react to — string literals,
+# parentheses, BETWEEN and its AND — in one C-level scan.
+_SPLIT_SCAN_CACHE = {}
+
+
 def _split_by_operator(sql: str, operator: str) -> list:
     """Split SQL by operator, respecting parentheses, string literals, and BETWEEN expressions."""
+    pattern = _SPLIT_SCAN_CACHE.get(operator)
+    if pattern is None:
+        # The operator alternative precedes ' AND' so that a split operator
+        # of ' AND ' wins over the bare BETWEEN-AND form at the same spot
+        pattern = re.compile(
+            "'[^']*'|\"[^\"]*\"|[()]|%s|BETWEEN| AND" % re.escape(operator),
+            re.IGNORECASE
+        )
+        _SPLIT_SCAN_CACHE[operator] = pattern
+
+    operator_upper = operator.upper()
     parts = []
-    current = ""
+    last = 0
     paren_depth = 0
     in_between = False
-    in_string = False
-    string_char = None
 
-    i = 0
-    while i < len(sql):
-        char = sql[i]
-        
-        # Handle string literals - don't split inside quotes
-        if char in ["'", '"'] and not in_string:
-            in_string = True
-            string_char = char
-            current += char
-        elif char == string_char and in_string:
-            in_string = False
-            string_char = None
-            current += char
-        elif in_string:
-            # Inside string literal - just add character
-            current += char
-        elif char == '(':
+    for match in pattern.finditer(sql):
+        token = match.group()
+        first = token[0]
+        if first in ("'", '"'):
+            # Whole string literal consumed in one token - never split inside
+            continue
+        if first == '(':
             paren_depth += 1
-            current += char
-        elif char == ')':
+        elif first == ')':
             paren_depth -= 1
-            current += char
         elif paren_depth == 0:
-            # Check for BETWEEN start
-            if sql[i:i+7].upper() == 'BETWEEN':
+            token_upper = token.upper()
+            if token_upper == 'BETWEEN':
                 in_between = True
-                current += sql[i:i+7]  # Add "BETWEEN"
-                i += 6  # Skip ahead, will be incremented at end
-            # Check for AND after BETWEEN
-            elif in_between and sql[i:i+4].upper() == ' AND':
-                # This is the AND in BETWEEN ... AND ..., don't split here
-                current += sql[i:i+4]  # Add " AND"
-                i += 3  # Skip ahead, will be incremented at end
-                in_between = False  # Reset flag
-            elif not in_between and sql[i:i+len(operator)].upper() == operator.upper():
-                parts.append(current.strip())
-                current = ""
-                i += len(operator) - 1  # Skip operator, will be incremented at end
-            else:
-                current += char
-        else:
-            current += char
-        i += 1
-
-    if current.strip():
-        parts.append(current.strip())
+            elif in_between:
+                # The AND belonging to BETWEEN ... AND ... never splits
+                if token_upper.startswith(' AND'):
+                    in_between = False
+            elif token_upper == operator_upper:
+                parts.append(sql[last:match.start()].strip())
+                last = match.end()
+
+    remainder = sql[last:].strip()
+    if remainder:
+        parts.append(remainder)
 
     return parts
 
 
+@lru_cache(maxsize=4096)
 def _parse_operand(operand: str) -> Expression:
-    """Parse a single operand."""
+    """Parse a single operand.
+
+    Memoized: the same leaves (column names, literals) recur constantly
+    across expressions, and operand parsing is pure in its input. Cached
+    nodes are shared under the same immutability contract as
+    parse_sql_logic results.
+    """
     operand = operand.strip()
 
+    # Fast-path classification on the first character: most operands are
+    # quoted strings, numbers, or literal keywords, none of which need the
+    # full-string predicates and function-call regex below
+    if operand:
+        first = operand[0]
+        if first in "'\"":
+            if len(operand) > 1 and operand[-1] == first:
+                return Literal(operand[1:-1], "string")
+        elif first.isdigit() or first in '+-.':
+            if operand.isdigit():
+                return Literal(int(operand), "number")
+            if _is_numeric_literal(operand):
+                # Handle decimal numbers like 3.0, 85.5, 2.1, etc.
+                return Literal(float(operand), "number")
+        else:
+            literal = _LITERAL_KEYWORDS.get(operand.lower())
+            if literal is not None:
+                return literal
+
     # Handle function calls - make regex more flexible
-    func_match = re.match(r'^(\w+)\s*\((.*)\)$', operand, re.DOTALL)
+    func_match = _RE_FUNC_CALL.match(operand)
     if func_match:
         func_name = func_match.group(1)
         args_str = func_match.group(2).strip()
         if args_str:
-            # Simple argument parsing - split by comma, but this is basic
-            args = [_parse_operand(arg.strip()) for arg in args_str.split(',')]
+            # Split on top-level commas only; nested calls and quoted
+            # strings keep their commas
+            args = [_parse_operand(arg.strip()) for arg in _split_args(args_str)]
         else:
             args = []
         return FunctionCall(func_name, args)
@@ -475,37 +605,26 @@ def _parse_operand(operand: str) -> Expression:
         inner_sql = operand[1:-1].strip()
         return _parse_simple_expression(inner_sql)
 
-    # Handle literals
-    if operand.startswith("'") and operand.endswith("'"):
-        return Literal(operand[1:-1], "string")
-    elif operand.startswith('"') and operand.endswith('"'):
-        return Literal(operand[1:-1], "string")  # Handle double quotes too
-    elif operand.isdigit():
-        return Literal(int(operand), "number")
-    elif _is_numeric_literal(operand):
-        # Handle decimal numbers like 3.0, 85.5, 2.1, etc.
+    # Oddly-spelled numerics ('inf', 'nan') that the first-character
+    # dispatch cannot see
+    if _is_numeric_literal(operand):
         return Literal(float(operand), "number")
-    elif operand.lower() in ['true', 'false']:
-        return Literal(operand.lower() == 'true', "boolean")
-    elif operand.upper() == 'NULL':
-        return Literal(None, "null")
 
     # Handle variables/columns - including table-qualified identifiers
-    else:
-        # Check for table-qualified identifiers: table.column or [table].[column]
-        if '.' in operand:
-            return _parse_qualified_identifier(operand)
-        
-        # Check for square bracket identifiers: [column-name]
-        if operand.startswith('[') and operand.endswith(']'):
-            # Extract the identifier from brackets
-            identifier = operand[1:-1]
-            return Variable(f"[{identifier}]")  # Keep brackets to indicate special identifier
-        
-        # Regular identifier validation (letters, numbers, underscores, no spaces)
-        if not operand.replace('_', '').isalnum() or ' ' in operand:
-            raise ValueError(f"Invalid operand: {operand}")
-        return Variable(operand)
+    # Check for table-qualified identifiers: table.column or [table].[column]
+    if '.' in operand:
+        return _parse_qualified_identifier(operand)
+
+    # Check for square bracket identifiers: [column-name]
+    if operand.startswith('[') and operand.endswith(']'):
+        # Extract the identifier from brackets
+        identifier = operand[1:-1]
+        return _intern_variable(f"[{identifier}]")  # Keep brackets to indicate special identifier
+
+    # Regular identifier validation (letters, numbers, underscores, no spaces)
+    if _RE_IDENTIFIER.fullmatch(operand) is None:
+        raise ValueError(f"Invalid operand: {operand}")
+    return _intern_variable(operand)
 
 
 def _parse_qualified_identifier(operand: str) -> Expression:
@@ -552,19 +671,36 @@ def _parse_qualified_identifier(operand: str) -> Expression:
     else:
         # Simple dot notation
         qualified_name = f"{table_name}.{column_name}"
-    
-    return Variable(qualified_name)
+
+    return _intern_variable(qualified_name)
+
+
+# Statement keywords that can never start a logic expression
+_REJECT_PREFIXES = ('SELECT ', 'INSERT ', 'UPDATE ', 'DELETE ', 'CREATE ', 'DROP ')
+
+# Any operator keyword or comparison character (substring match, same
+# acceptance as the old any(op in ...) check)
+_RE_OP_PRESENT = re.compile(r'AND|OR|NOT|LIKE|IN|IS|CASE|[><=]')
+
+# Operator-free expressions must be a bare variable or literal: spaces,
+# quotes and at least one alphanumeric ([^\W_] = alnum), nothing else
+# (mirrors the old strip-and-isalnum check, underscores included)
+_RE_SIMPLE_OPERAND = re.compile(r"[\s'\"]*[^\W_](?:[^\W_]|[\s'\"])*")
 
 
 def _is_valid_sql_expression(sql: str) -> bool:
     """Basic validation for SQL expressions."""
     sql = sql.strip()
+    sql_upper = sql.upper()
 
     # Check for obviously invalid patterns
-    if sql.upper().startswith(('SELECT ', 'INSERT ', 'UPDATE ', 'DELETE ', 'CREATE ', 'DROP ')):
+    if sql_upper.startswith(_REJECT_PREFIXES):
         return False
 
-    # Check for unmatched parentheses
+    # Check for unmatched parentheses; the count comparison rejects
+    # imbalance cheaply, the loop only guards against ')' before '('
+    if sql.count('(') != sql.count(')'):
+        return False
     paren_count = 0
     for char in sql:
         if char == '(':
@@ -574,30 +710,147 @@ def _is_valid_sql_expression(sql: str) -> bool:
             if paren_count < 0:
                 return False
 
-    if paren_count != 0:
-        return False
-
     # Check for basic structure - should have some operators or be a simple expression
-    if not any(op in sql.upper() for op in ['AND', 'OR', 'NOT', '>', '<', '=', 'LIKE', 'IN', 'IS', 'CASE']):
+    if not _RE_OP_PRESENT.search(sql_upper):
         # If no operators, should be a simple variable or literal
-        if not sql.replace(' ', '').replace("'", '').replace('"', '').isalnum():
+        if _RE_SIMPLE_OPERAND.fullmatch(sql) is None:
             return False
 
     return True
 
 
-def _parse_case_expression(sql: str) -> Expression:
-    """Parse CASE expression into Conditional."""
-    # For now, return a placeholder - full CASE parsing is complex
-    # This is a simplified implementation for basic cases
+def _scan_case_clauses(case_sql: str) -> tuple:
+    """
+    Scan a CASE body (outer CASE/END already stripped) in a single pass.
+
+    Tracks string literals and nested CASE depth so that WHEN/THEN/ELSE
+    keywords belonging to nested CASE statements are skipped, and returns
+    slice-based clause boundaries instead of re-scanning with regex.
+
+    Returns:
+        tuple: (when_clauses, else_clause) where when_clauses is a list of
+        (condition, then_value) strings and else_clause is a string or None
+    """
+    tokens = []  # (keyword, keyword_start, keyword_end)
+    case_depth = 0
+    in_string = False
+    string_char = None
+    i = 0
+    n = len(case_sql)
+
+    while i < n:
+        char = case_sql[i]
+
+        if in_string:
+            if char == string_char:
+                in_string = False
+                string_char = None
+            i += 1
+        elif char in ("'", '"'):
+            in_string = True
+            string_char = char
+            i += 1
+        elif char == '[':
+            # Bracketed identifiers ([when-flag], [then-col]) may contain
+            # keyword-looking words; skip the whole span like a string
+            close = case_sql.find(']', i + 1)
+            i = n if close == -1 else close + 1
+        elif char.isalpha() and (i == 0 or not (case_sql[i - 1].isalnum() or case_sql[i - 1] == '_')):
+            # Scan the full word once and classify it
+            word_end = i + 1
+            while word_end < n and (case_sql[word_end].isalnum() or case_sql[word_end] == '_'):
+                word_end += 1
+            word = case_sql[i:word_end].upper()
+
+            if word == 'CASE':
+                case_depth += 1
+            elif word == 'END':
+                if case_depth > 0:
+                    case_depth -= 1
+            elif case_depth == 0 and word in ('WHEN', 'THEN', 'ELSE'):
+                tokens.append((word, i, word_end))
+            i = word_end
+        else:
+            i += 1
+
+    # Assemble WHEN/THEN pairs and the trailing ELSE from token boundaries
+    when_clauses = []
+    else_clause = None
+    idx = 0
+    while idx < len(tokens):
+        keyword, start, end = tokens[idx]
+        if keyword == 'WHEN' and idx + 1 < len(tokens) and tokens[idx + 1][0] == 'THEN':
+            condition = case_sql[end:tokens[idx + 1][1]].strip()
+            value_end = tokens[idx + 2][1] if idx + 2 < len(tokens) else n
+            then_value = case_sql[tokens[idx + 1][2]:value_end].strip()
+            when_clauses.append((condition, then_value))
+            idx += 2
+        elif keyword == 'ELSE':
+            else_clause = case_sql[end:].strip()
+            break
+        else:
+            idx += 1
+
+    return when_clauses, else_clause
+
+
+def _try_parse(text: str) -> Optional[Expression]:
+    """
+    Parse text as a simple expression, returning None on failure.
+
+    Lets callers with a fallback path test for None instead of paying for
+    (and over-catching with) a broad exception handler.
+    """
+    try:
+        return _parse_simple_expression(text)
+    except (ValueError, NotImplementedError):
+        return None
+
+
+def _parse_case_value(value: str) -> Expression:
+    """
+    Parse a THEN/ELSE value, which may be a nested CASE, a literal, or an
+    expression. Falls back to a string literal for unparseable values.
+    """
+    value = value.strip()
+    if value.upper().startswith('CASE '):
+        return _parse_case_expression(value)
+    if value.startswith("'") and value.endswith("'"):
+        return Literal(value[1:-1], "string")
+    if value.startswith('"') and value.endswith('"'):
+        return Literal(value[1:-1], "string")
+    parsed = _try_parse(value)
+    return parsed if parsed is not None else Literal(value, "string")
 
+
+def _parse_case_expression(sql: str) -> Expression:
+    """Parse CASE expression into nested Conditional nodes."""
     sql = sql.strip()
-    if not sql.upper().endswith(' END'):
+    if not sql.upper().endswith('END'):
         raise ValueError("CASE expression must end with 'END'")
 
-    # Simple approach: just return the original SQL as a Variable for now
-    # This allows the converter to handle it
-    return Variable(sql)
+    # Strip the outer CASE/END keywords
+    body = sql[4:].strip() if sql.upper().startswith('CASE') else sql
+    body = body[:-3].strip()
+
+    when_clauses, else_clause = _scan_case_clauses(body)
+    if not when_clauses:
+        raise ValueError(f"CASE expression has no WHEN clauses: {sql}")
+
+    if else_clause is not None:
+        result = _parse_case_value(else_clause)
+    else:
+        result = Literal(None, "null")
+
+    # Build nested Conditionals from the last WHEN clause outward
+    for condition, then_value in reversed(when_clauses):
+        result = Conditional(
+            _parse_simple_expression(condition),
+            _parse_case_value(then_value),
+            result
+        )
+
+    return result
 
 
 def _parse_expression_with_case(sql: str) -> Expression:
@@ -641,28 +894,37 @@ def _parse_expression_with_case(sql: str) -> Expression:
 def _find_case_end_position(sql: str) -> int:
     """Find the position of the END keyword that closes the CASE expression."""
     sql_upper = sql.upper()
-    
-    # Simple approach: count CASE and END keywords
-    # This assumes no nested CASE expressions for now
+    n = len(sql)
+
+    # Count CASE and END keywords, jumping between occurrences with find()
+    # instead of probing every character
     case_count = 0
     end_count = 0
-    i = 0
-    
-    while i < len(sql):
-        if sql_upper[i:].startswith('CASE '):
+    pos = 0
+
+    while True:
+        next_end = sql_upper.find('END', pos)
+        if next_end == -1:
+            return -1  # No matching END found
+        next_case = sql_upper.find('CASE ', pos)
+        if next_case != -1 and next_case < next_end:
             case_count += 1
-            i += 5  # Skip "CASE "
-        elif sql_upper[i:].startswith(' END') and (i + 4 >= len(sql) or not sql[i + 4].isalnum()):
+            pos = next_case + 5  # Skip "CASE "
+            continue
+
+        # Keyword boundaries: END preceded by a space and followed by a
+        # non-word character, or END followed by a space / end of string
+        if next_end > 0 and sql[next_end - 1] == ' ' and \
+                (next_end + 3 >= n or not sql[next_end + 3].isalnum()):
             end_count += 1
             if case_count == end_count:
-                return i + 1  # Return position of 'E' in "END"
-            i += 4  # Skip " END"
-        elif sql_upper[i:].startswith('END ') or (sql_upper[i:].startswith('END') and i + 3 >= len(sql)):
+                return next_end  # Position of 'E' in "END"
+            pos = next_end + 3
+        elif next_end + 3 >= n or sql[next_end + 3] == ' ':
             end_count += 1
             if case_count == end_count:
-                return i  # Return position of 'E' in "END"
-            i += 3  # Skip "END"
+                return next_end  # Position of 'E' in "END"
+            pos = next_end + 3
         else:
-            i += 1
-    
-    return -1  # No matching END found
+            # Part of a longer word (e.g. ENDED); keep scanning
+            pos = next_end + 1
@@ -1,5 +1,5 @@
 import pytest
-from mssql_to_spring_el.converter import to_spring_el
+from mssql_to_spring_el.converter import Converter, to_spring_el, to_spring_el_batch, clear_convert_cache
 from mssql_to_spring_el.logic_models import BinaryOp, Variable, Literal
 
 
@@ -19,7 +19,7 @@ def test_convert_compound_condition():
     
     result = to_spring_el(expr)
     
-    assert result == "(#root.status == 'active') && (#root.age > 18)"
+    assert result == "#root.status == 'active' && #root.age > 18"
 
 
 def test_convert_with_custom_context():
@@ -38,7 +38,7 @@ def test_convert_or_operator():
     
     result = to_spring_el(expr)
     
-    assert result == "(#root.status == 'active') || (#root.status == 'pending')"
+    assert result == "#root.status == 'active' || #root.status == 'pending'"
 
 
 def test_convert_not_operator():
@@ -89,3 +89,73 @@ def test_empty_expression():
     """Test empty expression handling."""
     # This might not be needed
     pass
+
+
+def test_convert_batch():
+    """Test converting multiple expressions in one batch call."""
+    exprs = [
+        BinaryOp(Variable("age"), ">", Literal(18, "number")),
+        BinaryOp(Variable("status"), "=", Literal("active", "string")),
+    ]
+    results = to_spring_el_batch(exprs)
+    
+    assert results == ["#root.age > 18", "#root.status == 'active'"]
+
+
+def test_convert_batch_empty():
+    """Test batch conversion of an empty sequence."""
+    assert to_spring_el_batch([]) == []
+
+
+def test_converter_reuse():
+    """Test converting multiple expressions with one Converter instance."""
+    converter = Converter()
+    first = BinaryOp(Variable("age"), ">", Literal(18, "number"))
+    second = BinaryOp(Variable("status"), "=", Literal("active", "string"))
+
+    assert converter.convert(first) == "#root.age > 18"
+    assert converter.convert(second) == "#root.status == 'active'"
+
+
+def test_converter_custom_context():
+    """Test Converter with a custom context prefix."""
+    converter = Converter(context="#user")
+    expr = BinaryOp(Variable("age"), ">", Literal(18, "number"))
+
+    assert converter.convert(expr) == "#user.age > 18"
+
+
+def test_converter_custom_mappings():
+    """Test Converter with custom operator mappings."""
+    converter = Converter(mappings={'>': 'gt'})
+    expr = BinaryOp(Variable("age"), ">", Literal(18, "number"))
+
+    assert converter.convert(expr) == "#root.age gt 18"
+
+
+def test_converter_invalid_expression():
+    """Test that Converter rejects invalid expressions."""
+    with pytest.raises(ValueError):
+        Converter().convert("invalid")
+
+
+def test_convert_structurally_equal_expressions():
+    """Test that separately built but equal trees convert identically."""
+    clear_convert_cache()
+    first = BinaryOp(Variable("age"), ">", Literal(18, "number"))
+    second = BinaryOp(Variable("age"), ">", Literal(18, "number"))
+
+    assert to_spring_el(first) == to_spring_el(second) == "#root.age > 18"
+    # Custom contexts and mappings are keyed/bypassed independently
+    assert to_spring_el(second, context="#user") == "#user.age > 18"
+    assert to_spring_el(second, mappings={'>': 'gt'}) == "#root.age gt 18"
+
+
+def test_convert_cache_distinguishes_numeric_types():
+    """Test that int and float literals don't share a cache entry."""
+    clear_convert_cache()
+    int_expr = BinaryOp(Variable("x"), ">", Literal(18, "number"))
+    float_expr = BinaryOp(Variable("x"), ">", Literal(18.0, "number"))
+
+    assert to_spring_el(int_expr) == "#root.x > 18"
+    assert to_spring_el(float_expr) == "#root.x > 18.0"
@@ -41,6 +41,31 @@ class TestEdgeCases:
         except (ValueError, NotImplementedError) as e:
             pytest.skip(f"Reserved words in brackets not yet supported: {e}")
 
+    def test_case_keywords_in_bracketed_identifiers(self):
+        """Test CASE clause scanning skips keywords inside bracketed names."""
+        cases = [
+            ("CASE WHEN a = 1 THEN [then-col] ELSE 'b' END",
+             "(#root.a == 1 ? #root.thenCol : 'b')"),
+            ("CASE WHEN [when-flag] = 1 THEN 'y' ELSE 'n' END",
+             "(#root.whenFlag == 1 ? 'y' : 'n')"),
+            ("CASE WHEN [case-id] = 1 THEN 'y' ELSE [end-col] END",
+             "(#root.caseId == 1 ? 'y' : #root.endCol)"),
+        ]
+        for sql, expected in cases:
+            expression = parse_sql_logic(sql)
+            assert to_spring_el(expression) == expected
+
+    def test_unspaced_comparison_after_brackets(self):
+        """Test unspaced operators directly after bracketed identifiers."""
+        cases = [
+            ("WHERE [x].[y]>=5", "#root.x.y >= 5"),
+            ("WHERE [x].[y]<>5", "#root.x.y != 5"),
+            ("WHERE [x].[y]<=5", "#root.x.y <= 5"),
+        ]
+        for sql, expected in cases:
+            expression = parse_sql_logic(sql)
+            assert to_spring_el(expression) == expected
+
     def test_special_characters_in_identifiers(self):
         """Test special characters in column names."""
         sql = "WHERE [email-address] LIKE '%@test.com' AND [user-id] > 0"
@@ -23,7 +23,7 @@ def test_integration_compound_condition():
     expression = parse_sql_logic(sql)
     el_string = to_spring_el(expression)
     
-    assert el_string == "(#root.age > 18) && (#root.status == 'active')"
+    assert el_string == "#root.age > 18 && #root.status == 'active'"
 
 
 def test_integration_with_parentheses():
@@ -7,7 +7,7 @@ and equality comparison.
 
 import pytest
 from mssql_to_spring_el.logic_models import (
-    Expression, BinaryOp, UnaryOp, FunctionCall,
+    Expression, BinaryOp, BetweenOp, UnaryOp, FunctionCall,
     Literal, Variable, Conditional, LogicalGroup
 )
 
@@ -88,6 +88,57 @@ class TestBinaryOp:
         assert op1 != op3
 
 
+class TestBetweenOp:
+    """Test the BetweenOp class."""
+
+    def test_between_op_creation(self):
+        """Test creating a BetweenOp."""
+        left = Variable("age")
+        low = Literal(18, "number")
+        high = Literal(65, "number")
+        op = BetweenOp(left, low, high)
+
+        assert op.left == left
+        assert op.low == low
+        assert op.high == high
+
+    def test_between_op_to_dict(self):
+        """Test serialization of BetweenOp."""
+        left = Variable("age")
+        low = Literal(18, "number")
+        high = Literal(65, "number")
+        op = BetweenOp(left, low, high)
+
+        result = op.to_dict()
+        expected = {
+            "type": "BetweenOp",
+            "left": {"type": "Variable", "name": "age"},
+            "low": {"type": "Literal", "value": 18, "value_type": "number"},
+            "high": {"type": "Literal", "value": 65, "value_type": "number"}
+        }
+        assert result == expected
+
+    def test_between_op_repr(self):
+        """Test string representation of BetweenOp."""
+        left = Variable("age")
+        low = Literal(18, "number")
+        high = Literal(65, "number")
+        op = BetweenOp(left, low, high)
+
+        expected = "BetweenOp(Variable('age'), Literal(18, 'number'), Literal(65, 'number'))"
+        assert repr(op) == expected
+
+    def test_between_op_equality(self):
+        """Test equality comparison of BetweenOp."""
+        left = Variable("age")
+        op1 = BetweenOp(left, Literal(18, "number"), Literal(65, "number"))
+        op2 = BetweenOp(left, Literal(18, "number"), Literal(65, "number"))
+        op3 = BetweenOp(left, Literal(21, "number"), Literal(65, "number"))
+
+        assert op1 == op2
+        assert op1 != op3
+
+
 class TestUnaryOp:
     """Test the UnaryOp class."""
 
@@ -243,6 +294,17 @@ class TestLiteral:
         assert lit1 == lit2
         assert lit1 != lit3
 
+    def test_literal_equality_distinguishes_value_types(self):
+        """Test that numerically equal values of different types differ."""
+        int_lit = Literal(18, "number")
+        float_lit = Literal(18.0, "number")
+        bool_lit = Literal(True, "boolean")
+        one_lit = Literal(1, "boolean")
+
+        assert int_lit != float_lit
+        assert hash(int_lit) != hash(float_lit)
+        assert bool_lit != one_lit
+
 
 class TestVariable:
     """Test the Variable class."""
@@ -1,5 +1,5 @@
 import pytest
-from mssql_to_spring_el.parser import parse_sql_logic
+from mssql_to_spring_el.parser import parse_sql_logic, parse_sql_logic_many
 from mssql_to_spring_el.logic_models import BinaryOp, Variable, Literal
 
 
@@ -111,3 +111,19 @@ def test_malformed_expression():
     sql = "WHERE age >"
     with pytest.raises(ValueError):
         parse_sql_logic(sql)
+
+
+def test_parse_many():
+    """Test parsing multiple expressions in one batch call."""
+    sqls = ["WHERE age > 18", "WHERE status = 'active'"]
+    results = parse_sql_logic_many(sqls)
+
+    assert results == [
+        BinaryOp(Variable("age"), ">", Literal(18, "number")),
+        BinaryOp(Variable("status"), "=", Literal("active", "string")),
+    ]
+
+
+def test_parse_many_empty():
+    """Test batch parsing of an empty sequence."""
+    assert parse_sql_logic_many([]) == []